@@ -20,9 +20,10 @@ import io
 import json
 import os
 import re
+import threading
 import tkinter as tk
+import unicodedata
 from tkinter import filedialog, messagebox, ttk
-from urllib.error import URLError
 from urllib.request import Request, urlopen
 
 # Pillow は画像機能にのみ必要。なければ画像機能を無効化
@@ -31,6 +32,11 @@ try:
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
+# ImageGrab はクリップボード貼り付けにのみ使う。読めなくてもファイル選択は使える
+try:
+    from PIL import ImageGrab
+except ImportError:
+    ImageGrab = None
 
 # ─────────────────────────────────────────────
 ANKICONNECT_URL = "http://localhost:8765"
@@ -49,98 +55,147 @@ SUBJECTS = [
 ]
 
 # ── ノイズ行パターン ──────────────────────────
-NOISE_PATTERNS = [
-    re.compile(r"^\d{4}\s+\d+-\d+"),
-    re.compile(r"^基準値$"),
-    re.compile(r"^\d+-\d+$"),
-    re.compile(r"^リトライ$"),
-    re.compile(r"^\[掲載頁"),
-    re.compile(r"^ID\s*:"),
-    re.compile(r"^解答[:：]?\s*$"),
-    re.compile(r"^結果[:：]?\s*$"),
-    re.compile(r"^履歴"),
-    re.compile(r"^自分が登録"),
-    re.compile(r"^\d{4}/\d{1,2}/\d{1,2}"),
-    re.compile(r"^\*\s*$"),
-    re.compile(r".*[○◯]\s*正解"),
-    re.compile(r"^[×x]\s*不正解"),
-    re.compile(r"^ガイドライン$"),
-    re.compile(r"^基本事項など"),
+# 以下のパターンは NFKC 正規化済みの行 (normalize_for_match) に当てる。
+# 全角の記号・英数字は半角になっているので ASCII だけ書けばよい。
+# is_noise は strip 済みの行で判定するので、単純な行は文字列比較で済ませる
+NOISE_EXACT = frozenset({
+    "基準値", "リトライ", "ガイドライン", "*",
+    "解答", "解答:",
+    "結果", "結果:",
+})
+NOISE_PREFIX = ("[掲載頁", "履歴", "自分が登録", "基本事項など")
+NOISE_PATTERNS_SRC = [
+    r"^\d{4}\s+\d+-\d+",
+    r"^\d+-\d+$",
+    r"^ID\s*:",
+    r"^\d{4}/\d{1,2}/\d{1,2}",
+    r".*[○◯]\s*正解",
+    r"^[×x]\s*不正解",
 ]
-CHOICE_RE  = re.compile(r"^\*\s*[aAａ-ｅa-eA-E１-５1-5①-⑤]\s")
-CORRECT_RE = re.compile(r"^正解[:：]?\s*([aAａ-ｅa-eA-E１-５1-5①-⑤])", re.IGNORECASE)
+# 残りは1本の alternation にまとめて1回の match で判定する
+NOISE_RE_COMPLEX = re.compile("|".join(f"(?:{s})" for s in NOISE_PATTERNS_SRC))
+# 選択肢行 (* a ...) と正解行 (正解：a) を1回の match で判別する
+LINE_RE = re.compile(
+    r"^(?:\*\s*(?P<choice>[a-eA-E1-5])\s"
+    r"|正解:?\s*(?P<correct>[a-eA-E1-5]))"
+)
+
+
+def normalize_for_match(text: str) -> str:
+    """判定用の正規化 (①→1, ａ→a, ：→:, ＊→* など)"""
+    return unicodedata.normalize("NFKC", text)
 
 
 def is_noise(line: str) -> bool:
-    return any(p.match(line.strip()) for p in NOISE_PATTERNS)
+    s = line.strip()
+    return (s in NOISE_EXACT
+            or s.startswith(NOISE_PREFIX)
+            or NOISE_RE_COMPLEX.match(s) is not None)
 
 
-def to_half(c: str) -> str:
-    return chr(ord(c) - 0xFEE0) if "ａ" <= c <= "ｚ" or "Ａ" <= c <= "Ｚ" else c
+# 全角英字 → 半角英字
+_HALFWIDTH_TABLE = str.maketrans({
+    chr(c): chr(c - 0xFEE0)
+    for c in (*range(0xFF21, 0xFF3B), *range(0xFF41, 0xFF5B))
+})
 
 
-def parse_qb(text: str) -> dict:
-    explain_match = re.search(r"^解説\s*$", text, re.MULTILINE)
-    if explain_match:
-        before      = text[:explain_match.start()]
-        expl_lines  = text[explain_match.end():].splitlines()
-        explanation = "\n".join(
-            l for l in expl_lines if l.strip() and not is_noise(l)
-        ).strip()
-    else:
-        before      = text
-        explanation = ""
+def to_half(s: str) -> str:
+    return s.translate(_HALFWIDTH_TABLE)
 
-    lines    = before.splitlines()
-    question = ""
-    choices  = []
-    correct  = ""
 
-    for raw in lines:
-        line = raw.strip()
-        if not line or is_noise(line):
+def parse_qb(text: str) -> dict:
+    # 「解説」行までが問題部、以降が解説部。テキストは1回だけ走査する
+    question_parts = []
+    expl_parts     = []
+    choices        = []
+    correct        = ""
+    in_explain     = False
+
+    # 判定は NFKC 正規化した行 (key) で行い、カードには元の行を使う。
+    # 行頭の *・空白・正解・: は正規化しても1文字→1文字なので、
+    # key 上のマッチ位置をそのまま元の行に使える
+    keys = normalize_for_match(text).splitlines()
+    for raw, key in zip(text.splitlines(), keys):
+        key = key.strip()
+        if not key:
+            continue
+        if in_explain:
+            if not is_noise(key):
+                expl_parts.append(raw)
             continue
-        cm = CORRECT_RE.match(line)
-        if cm:
-            correct = to_half(cm.group(1)).upper()
+        # 見出しは行頭の「解説」のみ (字下げされた行は本文扱い)
+        if raw.rstrip() == "解説":
+            in_explain = True
             continue
-        if CHOICE_RE.match(line):
-            choices.append(re.sub(r"^\*\s*", "", line))
+        if is_noise(key):
             continue
-        question += ("\n" if question else "") + line
+        line = raw.strip()
+        m = LINE_RE.match(key)
+        if m is None:
+            question_parts.append(line)
+        elif m.group("correct"):
+            correct = to_half(line[m.start("correct")]).upper()
+        else:
+            choices.append(line[m.start("choice"):])
 
+    # 問題部の行は strip 済みなので join するだけでよい
     return {
-        "question":    question.strip(),
+        "question":    "\n".join(question_parts),
         "choices":     choices,
         "correct":     correct,
-        "explanation": explanation,
+        "explanation": "\n".join(expl_parts).strip(),
     }
 
 
 # ─────────────────────────────────────────────
 # 画像ユーティリティ
 # ─────────────────────────────────────────────
-def pil_image_to_png_bytes(img: "Image.Image") -> bytes:
-    """PIL Image → PNG bytes"""
+def has_alpha(img: "Image.Image") -> bool:
+    """透明ピクセルを実際に含むか"""
+    if img.mode in ("RGB", "L") and "transparency" not in img.info:
+        return False
+    # P / PA や透過色付きの画像も RGBA にしてからアルファを調べる
+    if img.mode not in ("RGBA", "LA"):
+        img = img.convert("RGBA")
+    return img.getchannel("A").getextrema()[0] < 255
+
+
+def pil_image_to_base64(img: "Image.Image") -> "tuple[str, str]":
+    """PIL Image → (MIMEタイプ, base64文字列)。透明部分がなければ JPEG"""
     buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    return buf.getvalue()
+    if has_alpha(img):
+        mime = "image/png"
+        if img.mode not in ("RGBA", "LA"):
+            img = img.convert("RGBA")
+        # 速度優先: zlib レベル1 (デフォルト6より大幅に速く、サイズ差はわずか)
+        img.save(buf, format="PNG", compress_level=1)
+    else:
+        mime = "image/jpeg"
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.save(buf, format="JPEG", quality=85)
+    # getbuffer() なら getvalue() のコピーを作らずに済む
+    return mime, base64.b64encode(buf.getbuffer()).decode("ascii")
 
 
-def png_bytes_to_base64(data: bytes) -> str:
-    return base64.b64encode(data).decode()
+def normalize_image_mode(img: "Image.Image") -> "Image.Image":
+    """RGB / RGBA / L 以外 (P, 1, I;16 など) と透過色付きの画像は RGBA にそろえる。
+    元のモードを保つので、RGB なら透明判定なしで JPEG 埋め込みできる"""
+    if img.mode not in ("RGB", "RGBA", "L") or "transparency" in img.info:
+        return img.convert("RGBA")
+    return img
 
 
 def get_clipboard_image(root: tk.Tk) -> "Image.Image | None":
     """クリップボードから画像を取得 (Windows/Mac/Linux)"""
-    if not HAS_PIL:
+    if not HAS_PIL or ImageGrab is None:
         return None
     try:
         # Windows: ImageGrab
-        from PIL import ImageGrab
         img = ImageGrab.grabclipboard()
         if isinstance(img, Image.Image):
-            return img
+            return normalize_image_mode(img)
     except Exception:
         pass
     return None
@@ -150,32 +205,50 @@ def load_image_from_file(path: str) -> "Image.Image | None":
     if not HAS_PIL:
         return None
     try:
-        return Image.open(path).convert("RGBA")
+        img = Image.open(path)
+        if img.format == "JPEG":
+            # カード埋め込み幅の2倍あれば十分なので、JPEGは縮小デコードさせる
+            img.draft("RGB", (IMG_MAX_PX * 2, IMG_MAX_PX * 2))
+        img.load()
+        return normalize_image_mode(img)
     except Exception:
         return None
 
 
 def resize_for_preview(img: "Image.Image", max_w: int = 300) -> "ImageTk.PhotoImage":
     """プレビュー用にリサイズして PhotoImage を返す"""
+    # プレビューは数秒見るだけなので BILINEAR で十分 (LANCZOS の数分の1の計算量)。
+    # 画質が効くカード埋め込み (image_to_html_tag) は LANCZOS のまま
     w, h = img.size
     if w > max_w:
-        img = img.resize((max_w, int(h * max_w / w)), Image.LANCZOS)
+        # 4K スクショなどは先に reduce (整数倍の平均化) で縮めてから補間する
+        factor = w // max_w
+        if factor >= 2:
+            img = img.reduce(factor)
+        img = img.resize((max_w, int(h * max_w / w)), Image.BILINEAR)
     return ImageTk.PhotoImage(img)
 
 
 def image_to_html_tag(img: "Image.Image") -> str:
     """PIL Image → Ankiカード埋め込み用 <img> タグ (base64)"""
-    # 最大幅に収める
+    # reduce() は P / 1 などのモードを受け付けないので先にそろえる
+    img = normalize_image_mode(img)
+    # 最大幅に収める。2倍以上大きい間は reduce(2) で半分にしてから LANCZOS
     w, h = img.size
+    while w >= 2 * IMG_MAX_PX:
+        img  = img.reduce(2)
+        w, h = img.size
     if w > IMG_MAX_PX:
         img = img.resize((IMG_MAX_PX, int(h * IMG_MAX_PX / w)), Image.LANCZOS)
-    data = png_bytes_to_base64(pil_image_to_png_bytes(img))
-    return f'<img src="data:image/png;base64,{data}" style="max-width:100%;margin:8px 0">'
+    mime, data = pil_image_to_base64(img)
+    return f'<img src="data:{mime};base64,{data}" style="max-width:100%;margin:8px 0">'
 
 
 # ─────────────────────────────────────────────
 # AnkiConnect
 # ─────────────────────────────────────────────
+# AnkiConnect は応答を返すたびにソケットを閉じる (Connection: close なし) ので
+# keep-alive で接続を使い回しても効果がない。リクエストごとに接続する
 def anki_request(action: str, **params):
     payload = json.dumps({"action": action, "version": 6, "params": params}).encode()
     req = Request(ANKICONNECT_URL, payload, {"Content-Type": "application/json"})
@@ -186,70 +259,121 @@ def anki_request(action: str, **params):
     return data["result"]
 
 
+def anki_multi(actions: list) -> list:
+    """複数アクションを multi で1リクエストにまとめて送る。1つでも失敗したら例外"""
+    results = anki_request("multi", actions=[dict(a, version=6) for a in actions])
+    for r in results:
+        if r.get("error"):
+            raise RuntimeError(r["error"])
+    return [r["result"] for r in results]
+
+
+# modelNames / modelFieldNames の結果はプロセス内でキャッシュする
+_MODEL_CACHE = {}
+
+
+def _resolve_basic_model_name() -> str:
+    models = anki_request("modelNames")
+    for c in ["Basic", "基本", "Básico", "Basique", "Basis"]:
+        if c in models:
+            return c
+    for name in models:
+        if len(anki_request("modelFieldNames", modelName=name)) >= 2:
+            return name
+    return models[0] if models else "Basic"
+
+
 def get_basic_model_name() -> str:
+    if "model" in _MODEL_CACHE:
+        return _MODEL_CACHE["model"]
     try:
-        models = anki_request("modelNames")
-        for c in ["Basic", "基本", "Básico", "Basique", "Basis"]:
-            if c in models:
-                return c
-        for name in models:
-            if len(anki_request("modelFieldNames", modelName=name)) >= 2:
-                return name
-        return models[0] if models else "Basic"
+        name = _resolve_basic_model_name()
+        _MODEL_CACHE["fields"] = anki_request("modelFieldNames", modelName=name)
     except Exception:
         return "Basic"
+    _MODEL_CACHE["model"] = name
+    return name
+
+
+def get_model_field_names() -> list:
+    """get_basic_model_name() のモデルのフィールド名 (キャッシュ済み)"""
+    model_name = get_basic_model_name()
+    if "fields" not in _MODEL_CACHE:
+        return anki_request("modelFieldNames", modelName=model_name)
+    return _MODEL_CACHE["fields"]
+
+
+def clear_model_cache():
+    """Anki側でモデルが変わった可能性があるときに呼ぶ"""
+    _MODEL_CACHE.clear()
 
 
 # ─────────────────────────────────────────────
 # HTML builders
 # ─────────────────────────────────────────────
+# カードのHTMLはノートごとに変わる部分だけ差し込む
+_SUBJECT_TAG_TEMPLATE = (
+    '<div style="display:inline-block;background:#0d7377;color:#fff;'
+    'font-size:11px;padding:2px 10px;border-radius:12px;'
+    'margin-bottom:10px;font-weight:700">{subject}</div><br>'
+)
+# 最後の選択肢だけ下線なし
+_CHOICE_TEMPLATE      = '<div style="padding:5px 0;border-bottom:1px solid #dde8f0;">{choice}</div>'
+_LAST_CHOICE_TEMPLATE = '<div style="padding:5px 0;">{choice}</div>'
+_CHOICES_TEMPLATE  = (
+    '<div style="border-left:3px solid #0d7377;padding-left:12px;margin-top:10px">'
+    '{choices}</div>'
+)
+_FRONT_TEMPLATE = (
+    '<div style="font-family:\'Noto Sans JP\',sans-serif;font-size:15px;'
+    'line-height:1.8;color:#1a1a2e;max-width:640px;margin:0 auto;text-align:center">'
+    '{tag}'
+    '<div style="font-weight:600;margin-bottom:10px">{question}</div>'
+    '{choices}'
+    '{img}'
+    '</div>'
+)
+_CORRECT_BOX_TEMPLATE = (
+    '<div style="background:#e8f8f5;border:2px solid #0d7377;border-radius:8px;'
+    'padding:10px 16px;margin-bottom:14px;font-size:20px;font-weight:700;'
+    'color:#0d7377;text-align:center">正解：{correct}</div>'
+)
+_EXPL_BOX_TEMPLATE = (
+    '<div style="background:#f8f9fa;border-radius:8px;padding:14px 16px;'
+    'font-size:13px;line-height:1.85;text-align:left">{explanation}</div>'
+)
+_BACK_TEMPLATE = (
+    '<div style="font-family:\'Noto Sans JP\',sans-serif;font-size:14px;'
+    'line-height:1.8;color:#1a1a2e;max-width:640px;margin:0 auto;text-align:center">'
+    '{correct}{explanation}{img}</div>'
+)
+
+
 def build_front(p: dict, subject: str, img: "Image.Image | None" = None) -> str:
-    tag = (f'<div style="display:inline-block;background:#0d7377;color:#fff;'
-           f'font-size:11px;padding:2px 10px;border-radius:12px;'
-           f'margin-bottom:10px;font-weight:700">{subject}</div><br>'
-           if subject else "")
-    q = p["question"].replace("\n", "<br>")
-    choices_html = "".join(
-        f'<div style="padding:5px 0;'
-        f'{"border-bottom:1px solid #dde8f0;" if i < len(p["choices"])-1 else ""}">'
-        f'{c}</div>'
-        for i, c in enumerate(p["choices"])
-    )
-    choices_block = (
-        f'<div style="border-left:3px solid #0d7377;padding-left:12px;margin-top:10px">'
-        f'{choices_html}</div>'
-        if choices_html else ""
-    )
-    img_html = image_to_html_tag(img) if img else ""
-    return (
-        f'<div style="font-family:\'Noto Sans JP\',sans-serif;font-size:15px;'
-        f'line-height:1.8;color:#1a1a2e;max-width:640px;margin:0 auto;text-align:center">'
-        f'{tag}'
-        f'<div style="font-weight:600;margin-bottom:10px">{q}</div>'
-        f'{choices_block}'
-        f'{img_html}'
-        f'</div>'
+    tag = _SUBJECT_TAG_TEMPLATE.format(subject=subject) if subject else ""
+    choices_block = ""
+    if p["choices"]:
+        *mid, last = p["choices"]
+        parts = [_CHOICE_TEMPLATE.format(choice=c) for c in mid]
+        parts.append(_LAST_CHOICE_TEMPLATE.format(choice=last))
+        choices_block = _CHOICES_TEMPLATE.format(choices="".join(parts))
+    return _FRONT_TEMPLATE.format(
+        tag=tag,
+        question=p["question"].replace("\n", "<br>"),
+        choices=choices_block,
+        img=image_to_html_tag(img) if img else "",
     )
 
 
 def build_back(p: dict, img: "Image.Image | None" = None) -> str:
-    correct_html = (
-        f'<div style="background:#e8f8f5;border:2px solid #0d7377;border-radius:8px;'
-        f'padding:10px 16px;margin-bottom:14px;font-size:20px;font-weight:700;'
-        f'color:#0d7377;text-align:center">正解：{p["correct"]}</div>'
-        if p["correct"] else ""
-    )
+    correct_html = (_CORRECT_BOX_TEMPLATE.format(correct=p["correct"])
+                    if p["correct"] else "")
     expl = p["explanation"].replace("\n", "<br>")
-    expl_html = (
-        f'<div style="background:#f8f9fa;border-radius:8px;padding:14px 16px;'
-        f'font-size:13px;line-height:1.85;text-align:left">{expl}</div>'
-        if expl else ""
-    )
-    img_html = image_to_html_tag(img) if img else ""
-    return (
-        f'<div style="font-family:\'Noto Sans JP\',sans-serif;font-size:14px;'
-        f'line-height:1.8;color:#1a1a2e;max-width:640px;margin:0 auto;text-align:center">'
-        f'{correct_html}{expl_html}{img_html}</div>'
+    expl_html = _EXPL_BOX_TEMPLATE.format(explanation=expl) if expl else ""
+    return _BACK_TEMPLATE.format(
+        correct=correct_html,
+        explanation=expl_html,
+        img=image_to_html_tag(img) if img else "",
     )
 
 
@@ -316,11 +440,16 @@ class ImagePanel(tk.Frame):
                 self._set_image(img)
 
     def _set_image(self, img: "Image.Image"):
+        if self._image is not None and self._image is not img:
+            self._image.close()
         self._image = img
         self._photo = resize_for_preview(img, max_w=320)
         self._canvas.config(image=self._photo, text="", height=0)
 
     def _clear(self):
+        # GCを待たずにピクセルバッファを解放する
+        if self._image is not None:
+            self._image.close()
         self._image = None
         self._photo = None
         self._canvas.config(image="", text="（画像なし）", height=4)
@@ -369,6 +498,7 @@ class App(tk.Tk):
         self._parsed    = None
         self._img_front = None  # ImagePanel (preview tab)
         self._img_back  = None  # ImagePanel (preview tab)
+        self._edit_vars = {}    # 手動修正欄の Text (preview tab)
         apply_styles(self)
         self._build_ui()
 
@@ -429,8 +559,9 @@ class App(tk.Tk):
         self._lbl(parent, "AnkiConnect 状態", style="H.TLabel")
         self.lbl_status = ttk.Label(parent, text="● 未確認", style="TLabel")
         self.lbl_status.pack(anchor="w")
-        ttk.Button(parent, text="接続確認", style="Sub.TButton",
-                   command=self._check_anki).pack(fill="x", pady=(6, 0))
+        self.btn_check = ttk.Button(parent, text="接続確認", style="Sub.TButton",
+                                    command=self._check_anki)
+        self.btn_check.pack(fill="x", pady=(6, 0))
 
     def _build_input_tab(self):
         frame = ttk.Frame(self.nb)
@@ -489,24 +620,40 @@ class App(tk.Tk):
         btn_row.grid(row=1, column=0, columnspan=2, sticky="ew", pady=8, padx=4)
         ttk.Button(btn_row, text="← 戻る", style="Sub.TButton",
                    command=lambda: self.nb.select(0)).pack(side="left", padx=(0, 8))
-        ttk.Button(btn_row, text="  ⚕  Ankiに追加する  ",
-                   style="Accent.TButton",
-                   command=self._send_to_anki).pack(side="right")
+        self.btn_send = ttk.Button(btn_row, text="  ⚕  Ankiに追加する  ",
+                                   style="Accent.TButton",
+                                   command=self._send_to_anki)
+        self.btn_send.pack(side="right")
         self.lbl_result = ttk.Label(btn_row, text="", style="TLabel")
         self.lbl_result.pack(side="right", padx=12)
 
     # ── ロジック ─────────────────────────────
     def _check_anki(self):
+        # Anki が落ちているとタイムアウトまで待つので、送信と同じく別スレッドで行う
+        self.btn_check.state(["disabled"])
+        self.lbl_status.config(text="● 確認中…", foreground="#8aacc8")
+        threading.Thread(target=self._check_worker, daemon=True).start()
+
+    def _check_worker(self):
+        """バックグラウンドスレッドで実行。結果は after() でメインスレッドに戻す"""
         try:
             anki_request("version")
-            self.lbl_status.config(text="✓ 接続OK", foreground="#14c4ab")
         except Exception:
-            self.lbl_status.config(text="✗ 接続失敗", foreground="#ff6b6b")
-            messagebox.showerror("接続エラー",
-                "AnkiConnectに接続できません。\n\n"
-                "・Ankiが起動しているか確認してください\n"
-                "・アドオン 2055492159 (AnkiConnect) がインストールされているか確認してください\n\n"
-                'Config に "webCorsOriginList": ["*"] を追加してください')
+            self.after(0, lambda: self._on_check_done(False))
+        else:
+            self.after(0, lambda: self._on_check_done(True))
+
+    def _on_check_done(self, ok: bool):
+        self.btn_check.state(["!disabled"])
+        if ok:
+            self.lbl_status.config(text="✓ 接続OK", foreground="#14c4ab")
+            return
+        self.lbl_status.config(text="✗ 接続失敗", foreground="#ff6b6b")
+        messagebox.showerror("接続エラー",
+            "AnkiConnectに接続できません。\n\n"
+            "・Ankiが起動しているか確認してください\n"
+            "・アドオン 2055492159 (AnkiConnect) がインストールされているか確認してください\n\n"
+            'Config に "webCorsOriginList": ["*"] を追加してください')
 
     def _do_parse(self):
         text = self.txt_input.get("1.0", "end").strip()
@@ -517,16 +664,8 @@ class App(tk.Tk):
         self._refresh_preview()
         self.nb.select(1)
 
-    def _refresh_preview(self):
-        for w in self.preview_inner.winfo_children():
-            w.destroy()
-        self._img_front = None
-        self._img_back  = None
-
-        p = self._parsed
-        if not p:
-            return
-
+    def _build_preview_widgets(self):
+        """プレビューの中身を1回だけ作る。以降は _refresh_preview で内容だけ差し替える"""
         def section(title):
             tk.Label(self.preview_inner, text=title,
                      bg="#0a0e1a", fg="#5a7fa8",
@@ -539,38 +678,23 @@ class App(tk.Tk):
             f.pack(fill="x", padx=4, pady=2)
             return f
 
-        def card_text(parent, text, **kw):
+        def card_text(parent):
             t = tk.Text(parent, bg="#ffffff", fg="#1a1a2e",
                         font=("Yu Gothic UI", 11), relief="flat",
                         wrap="word", padx=12, pady=10,
-                        highlightthickness=0, **kw)
-            t.insert("end", text)
-            t.config(state="disabled")
+                        highlightthickness=0, state="disabled")
             t.pack(fill="x")
             return t
 
         # FRONT
         section("FRONT（表面）")
-        ff = card_frame()
-        front_text = p["question"]
-        if p["choices"]:
-            front_text += "\n\n" + "\n".join(p["choices"])
-        card_text(ff, front_text, height=max(3, front_text.count("\n") + 2))
-
+        self._front_text = card_text(card_frame())
         self._img_front = ImagePanel(self.preview_inner, "表面", self)
         self._img_front.pack(fill="x", padx=4, pady=(2, 6))
 
         # BACK
         section("BACK（裏面）")
-        bf = card_frame()
-        back_text = ""
-        if p["correct"]:
-            back_text += f"正解：{p['correct']}\n\n"
-        if p["explanation"]:
-            back_text += p["explanation"]
-        card_text(bf, back_text.strip(),
-                  height=min(18, max(4, back_text.count("\n") + 2)))
-
+        self._back_text = card_text(card_frame())
         self._img_back = ImagePanel(self.preview_inner, "裏面", self)
         self._img_back.pack(fill="x", padx=4, pady=(2, 6))
 
@@ -585,7 +709,6 @@ class App(tk.Tk):
         edit_frame.pack(fill="x", padx=4)
         edit_frame.columnconfigure(1, weight=1)
 
-        self._edit_vars = {}
         for row, (label, key, h) in enumerate([
             ("問題文", "question", 2),
             ("正解",   "correct",  1),
@@ -600,12 +723,47 @@ class App(tk.Tk):
                         wrap="word", height=h, padx=6, pady=4,
                         highlightthickness=1, highlightbackground="#1e3a5f",
                         highlightcolor="#0d7377")
-            t.insert("end", p.get(key, ""))
             t.grid(row=row, column=1, sticky="ew", padx=(0, 10), pady=(8, 4))
             self._edit_vars[key] = t
 
+    def _refresh_preview(self):
+        p = self._parsed
+        if not p:
+            return
+        # 初回の解析時にだけウィジェットを作る (解析前のタブは空のまま)
+        if not self._edit_vars:
+            self._build_preview_widgets()
+
+        def set_text(t, text, **kw):
+            t.config(state="normal", **kw)
+            t.delete("1.0", "end")
+            t.insert("end", text)
+
+        front_text = p["question"]
+        if p["choices"]:
+            front_text += "\n\n" + "\n".join(p["choices"])
+        set_text(self._front_text, front_text,
+                 height=max(3, front_text.count("\n") + 2))
+        self._front_text.config(state="disabled")
+
+        back_parts = []
+        if p["correct"]:
+            back_parts.append(f"正解：{p['correct']}")
+        if p["explanation"]:
+            back_parts.append(p["explanation"])
+        back_text = "\n\n".join(back_parts)
+        set_text(self._back_text, back_text,
+                 height=min(18, max(4, back_text.count("\n") + 2)))
+        self._back_text.config(state="disabled")
+
+        self._img_front._clear()
+        self._img_back._clear()
+
+        for key, t in self._edit_vars.items():
+            set_text(t, p.get(key, ""))
+
     def _get_edited(self) -> dict:
-        if not hasattr(self, "_edit_vars"):
+        if not self._edit_vars:
             return self._parsed
         return {
             "question":    self._edit_vars["question"].get("1.0", "end").strip(),
@@ -619,41 +777,77 @@ class App(tk.Tk):
             messagebox.showwarning("未解析", "先に問題を解析してください。")
             return
 
+        sent    = self._parsed
         p       = self._get_edited()
         deck    = self.var_deck.get()
         subject = self.var_subject.get().strip()
         extra   = [t.strip() for t in self.var_tags.get().split(",") if t.strip()]
         tags    = (["科目::" + subject] if subject else []) + ["QB"] + extra
 
+        # 送信中にパネル側で画像が差し替え・解放されてもよいようにコピーを渡す
         img_f = self._img_front.image if self._img_front else None
         img_b = self._img_back.image  if self._img_back  else None
-
-        front = build_front(p, subject, img_f)
-        back  = build_back(p, img_b)
-
+        img_f = img_f.copy() if img_f else None
+        img_b = img_b.copy() if img_b else None
+
+        # 画像のエンコードと通信は UI を止めないよう別スレッドで行う
+        self.btn_send.state(["disabled"])
+        self.lbl_result.config(text="送信中…", foreground="#8aacc8")
+        threading.Thread(target=self._send_worker,
+                         args=(sent, p, deck, subject, tags, img_f, img_b),
+                         daemon=True).start()
+
+    def _send_worker(self, sent, p, deck, subject, tags, img_f, img_b):
+        """バックグラウンドスレッドで実行。Tk の操作は after() でメインスレッドに戻す"""
         try:
-            anki_request("createDeck", deck=deck)
+            front = build_front(p, subject, img_f)
+            back  = build_back(p, img_b)
             model_name  = get_basic_model_name()
-            field_names = anki_request("modelFieldNames", modelName=model_name)
+            field_names = get_model_field_names()
             front_field = field_names[0] if field_names else "Front"
             back_field  = field_names[1] if len(field_names) > 1 else "Back"
-            anki_request("addNote", note={
-                "deckName":  deck,
-                "modelName": model_name,
-                "fields":    {front_field: front, back_field: back},
-                "tags":      tags,
-                "options":   {"allowDuplicate": False, "duplicateScope": "deck"},
-            })
-            self.lbl_result.config(text="✓ 追加しました", foreground="#14c4ab")
-            self.txt_input.delete("1.0", "end")
-            self._parsed = None
-            self.nb.select(0)
+            # モデル情報はキャッシュ済みなので、通常はこの1リクエストだけで済む
+            anki_multi([
+                {"action": "createDeck", "params": {"deck": deck}},
+                {"action": "addNote", "params": {"note": {
+                    "deckName":  deck,
+                    "modelName": model_name,
+                    "fields":    {front_field: front, back_field: back},
+                    "tags":      tags,
+                    "options":   {"allowDuplicate": False, "duplicateScope": "deck"},
+                }}},
+            ])
         except Exception as e:
-            self.lbl_result.config(text="✗ 失敗", foreground="#ff6b6b")
-            messagebox.showerror("Ankiエラー",
-                f"カードの追加に失敗しました。\n\n{e}\n\n"
-                "・Ankiが起動しているか確認してください。\n"
-                "・AnkiConnectのCORS設定を確認してください。")
+            clear_model_cache()
+            self.after(0, lambda e=e: self._on_send_fail(e))
+        else:
+            self.after(0, lambda: self._on_send_ok(sent))
+        finally:
+            for img in (img_f, img_b):
+                if img is not None:
+                    img.close()
+
+    def _on_send_ok(self, sent: dict):
+        self.btn_send.state(["!disabled"])
+        self.lbl_result.config(text="✓ 追加しました", foreground="#14c4ab")
+        # 送信中に次の問題が解析されていたら、そちらの入力・画像は消さない
+        if self._parsed is not sent:
+            return
+        self.txt_input.delete("1.0", "end")
+        self._parsed = None
+        # 送信済みの画像を次の解析まで抱えたままにしない
+        if self._img_front:
+            self._img_front._clear()
+            self._img_back._clear()
+        self.nb.select(0)
+
+    def _on_send_fail(self, e: Exception):
+        self.btn_send.state(["!disabled"])
+        self.lbl_result.config(text="✗ 失敗", foreground="#ff6b6b")
+        messagebox.showerror("Ankiエラー",
+            f"カードの追加に失敗しました。\n\n{e}\n\n"
+            "・Ankiが起動しているか確認してください。\n"
+            "・AnkiConnectのCORS設定を確認してください。")
 
 
 # ─────────────────────────────────────────────